@@ -0,0 +1 @@
+"""Shared tutor and analytics components used by the app pages."""
@@ -11,11 +11,17 @@ Provides a tutor page with:
 - Lightweight chat with an LLM focused on the Data Engineer roadmap
 """
 
+import functools
+import itertools
 import json
+import operator
 import os
 import re
-from datetime import datetime
-from typing import Dict, List, Any
+import tempfile
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Sequence, Tuple, Any
 
 import streamlit as st
 from dotenv import load_dotenv
@@ -25,9 +31,32 @@ try:
 except Exception:  # pragma: no cover - OpenAI may not be installed in all envs
     OpenAI = None  # type: ignore
 
+from components.llm_cache import get_cached_reply, make_cache_key, store_reply
+
 load_dotenv()
 
 DEFAULT_CHAT_MODEL = "gpt-4o-mini"
+# Read once at import (after load_dotenv); set OPENAI_CHAT_MODEL before starting the app
+_MODEL_NAME = os.getenv("OPENAI_CHAT_MODEL", DEFAULT_CHAT_MODEL)
+TUTOR_SYSTEM_PROMPT = (
+    "You are an Adaptive AI Tutor for Data Engineers. "
+    "Focus ONLY on data engineering topics such as Python, SQL, "
+    "data storage, data pipelines, batch vs streaming, cloud "
+    "services, governance and testing. "
+    "Explain concepts clearly and concisely using step-by-step "
+    "reasoning when helpful. Do NOT ask quiz questions unless "
+    "the user explicitly requests practice questions."
+)
+# Bounded chat memory: full history for display/digest, short window for the LLM
+CHAT_HISTORY_LIMIT = 200
+LLM_CONTEXT_MESSAGES = 6
+CHAT_RENDER_WINDOW = 50
+LEVEL_LABELS = {
+    1: "Beginner",
+    2: "Emerging",
+    3: "Proficient",
+    4: "Advanced",
+}
 RESPONSES_ONLY_PREFIXES = ("gpt-4.1", "o1", "o3")
 PRACTICE_KEYWORDS = (
     "practice",
@@ -44,89 +73,150 @@ PRACTICE_KEYWORDS = (
     "retention",
     "recap",
 )
-SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# One case-insensitive alternation instead of a substring scan per keyword
+PRACTICE_RE = re.compile("|".join(map(re.escape, PRACTICE_KEYWORDS)), re.IGNORECASE)
+# A sentence runs until ., ! or ? followed by whitespace (same boundaries as
+# splitting on r"(?<=[.!?])\s+"), so finditer walks sentences without a list
+SENTENCE_RE = re.compile(r"(?:[^.!?]|[.!?](?!\s))*[.!?]?")
 
 
 # ---------- Paths & persistence ----------
 
+# Resolved once at import; the data directory never moves at runtime
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+os.makedirs(_DATA_DIR, exist_ok=True)
+_EVENTS_PATH = os.path.join(_DATA_DIR, "tutor_events.jsonl")
+_LEGACY_EVENTS_PATH = os.path.join(_DATA_DIR, "tutor_events.json")
+# Derived {user_id: latest summary} map kept beside the raw log
+_SUMMARY_INDEX_PATH = os.path.join(_DATA_DIR, "latest_summary.json")
+
+
 def _get_data_dir() -> str:
     """Return the directory where tutor analytics data is stored."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    data_dir = os.path.join(base_dir, "data")
-    os.makedirs(data_dir, exist_ok=True)
-    return data_dir
+    return _DATA_DIR
 
 
 def _get_events_path() -> str:
-    return os.path.join(_get_data_dir(), "tutor_events.json")
+    return _EVENTS_PATH
 
 
-def _load_events() -> List[Dict[str, Any]]:
-    """Load all tutor events from JSON; return empty list if none."""
+def _get_legacy_events_path() -> str:
+    """Path of the pre-JSONL event log (a single JSON array)."""
+    return _LEGACY_EVENTS_PATH
+
+
+def _migrate_legacy_events() -> None:
+    """One-time conversion of the old JSON array log into JSON Lines."""
+    legacy_path = _get_legacy_events_path()
+    path = _get_events_path()
+    if os.path.exists(path) or not os.path.exists(legacy_path):
+        return
+    try:
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            events = json.load(f)
+    except Exception:
+        return
+    _append_events(events)
+    os.remove(legacy_path)
+
+
+def _iter_events() -> Iterator[Dict[str, Any]]:
+    """Stream tutor events from the JSONL log, skipping unreadable lines."""
     path = _get_events_path()
     if not os.path.exists(path):
-        return []
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def _load_events() -> List[Dict[str, Any]]:
+    """Load all tutor events (including buffered ones); empty list if none."""
+    _migrate_legacy_events()
+    _flush_events()
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return list(_iter_events())
     except Exception:
         return []
 
 
-def _save_events(events: List[Dict[str, Any]]) -> None:
-    """Persist all tutor events to JSON."""
+def _append_events(events: List[Dict[str, Any]]) -> None:
+    """Append events to the JSONL log with a single write."""
+    if not events:
+        return
     path = _get_events_path()
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(events, f, indent=2)
-
-
-def _log_event(event_type: str, user_id: str, payload: Dict[str, Any]) -> None:
-    """Append a single analytics event."""
-    events = _load_events()
-    events.append(
-        {
-            "type": event_type,
-            "user_id": user_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "data": payload,
-        }
+    lines = "".join(
+        json.dumps(ev, separators=(",", ":"), ensure_ascii=False) + "\n" for ev in events
     )
-    _save_events(events)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(lines)
 
 
-def _build_recent_practice_digest(
-    messages: List[Dict[str, Any]], max_entries: int = 3
-) -> str:
-    """
-    Build a short recap of recent practice-focused chat snippets.
-    """
-    if not messages:
-        return (
-            "I didn't spot specific practice highlights yet. Ask for a quick drill "
-            "or share what you just practiced, then try again."
-        )
+def _flush_events() -> None:
+    """Write this session's queued events to disk in one append."""
+    pending = st.session_state.get("pending_tutor_events")
+    if not pending:
+        return
+    batch = list(pending)
+    pending.clear()
+    _append_events(batch)
+
+
+def _format_timestamp(ts: Any) -> Any:
+    """Render an epoch-seconds timestamp as ISO-8601 UTC; legacy ISO strings pass through."""
+    if isinstance(ts, (int, float)):
+        return datetime.fromtimestamp(ts, timezone.utc).isoformat().replace("+00:00", "Z")
+    return ts
 
+
+def _log_event(event_type: str, user_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Queue a single analytics event for the end-of-rerun flush. Returns the record."""
+    record = {
+        "type": event_type,
+        "user_id": user_id,
+        "timestamp": time.time(),
+        "data": payload,
+    }
+    if "pending_tutor_events" not in st.session_state:
+        st.session_state.pending_tutor_events = []
+    st.session_state.pending_tutor_events.append(record)
+    return record
+
+
+def _collect_practice_highlights(
+    messages: List[Dict[str, Any]], max_entries: int
+) -> List[str]:
+    """Return up to max_entries practice sentences, newest message first."""
     highlights: List[str] = []
     for message in reversed(messages):
         content = str(message.get("content", "")).strip()
-        if not content:
+        # Skip the sentence split entirely when nothing in the message matches
+        if not content or not PRACTICE_RE.search(content):
             continue
 
-        sentences = SENTENCE_SPLIT_RE.split(content)
-        for sentence in sentences:
-            cleaned = sentence.strip()
-            if not cleaned:
-                continue
-
-            normalized = cleaned.lower()
-            if any(keyword in normalized for keyword in PRACTICE_KEYWORDS):
-                speaker = "You" if message.get("role") == "user" else "Tutor"
+        speaker = "You" if message.get("role") == "user" else "Tutor"
+        for match in SENTENCE_RE.finditer(content):
+            cleaned = match.group().strip()
+            if cleaned and PRACTICE_RE.search(cleaned):
                 highlights.append(f"- {speaker}: {cleaned}")
                 if len(highlights) >= max_entries:
-                    break
-        if len(highlights) >= max_entries:
-            break
+                    return highlights
+    return highlights
+
 
+def _build_recent_practice_digest(
+    messages: List[Dict[str, Any]], max_entries: int = 3
+) -> str:
+    """
+    Build a short recap of recent practice-focused chat snippets.
+    """
+    highlights = _collect_practice_highlights(messages, max_entries) if messages else []
     if highlights:
         return (
             "Here’s a quick retention recap based on your recent chat:\n"
@@ -140,6 +230,7 @@ def _build_recent_practice_digest(
 
 # ---------- LLM helpers ----------
 
+@functools.lru_cache(maxsize=8)
 def _should_use_responses_api(model_name: str) -> bool:
     """Return True if the selected model only supports the Responses API."""
     if not model_name:
@@ -152,22 +243,36 @@ def _messages_to_responses_input(messages: List[Dict[str, Any]]) -> List[Dict[st
     """
     Convert Chat Completions style messages to Responses API input format.
     """
+    # Fast path: the tutor only ever sends plain string content
+    if not any(isinstance(m.get("content"), list) for m in messages):
+        return [
+            {
+                "role": m.get("role", "user"),
+                "content": [
+                    {
+                        "type": "output_text" if m.get("role") == "assistant" else "input_text",
+                        "text": str(m.get("content", "")),
+                    }
+                ],
+            }
+            for m in messages
+        ]
+
     formatted = []
     for message in messages:
         role = message.get("role", "user")
         content = message.get("content", "")
+        content_type = "input_text" if role != "assistant" else "output_text"
 
-        content_blocks: List[Dict[str, Any]] = []
         if isinstance(content, list):
+            content_blocks: List[Dict[str, Any]] = []
             for block in content:
                 if isinstance(block, dict):
                     block_text = block.get("text") or block.get("content") or ""
                 else:
                     block_text = str(block)
-                content_type = "input_text" if role != "assistant" else "output_text"
                 content_blocks.append({"type": content_type, "text": str(block_text)})
         else:
-            content_type = "input_text" if role != "assistant" else "output_text"
             content_blocks = [{"type": content_type, "text": str(content)}]
 
         formatted.append({"role": role, "content": content_blocks})
@@ -178,144 +283,157 @@ def _extract_text_from_responses(response: Any) -> str:
     """
     Safely pull assistant text from a Responses API result.
     """
-    chunks: List[str] = []
+    # The SDK already aggregates the text output; prefer it
+    output_text = getattr(response, "output_text", None)
+    if isinstance(output_text, list):
+        output_text = "\n".join(output_text)
+    if isinstance(output_text, str) and output_text.strip():
+        return output_text.strip()
 
-    output = getattr(response, "output", None) or []
-    for item in output:
-        content_list = getattr(item, "content", None) or []
-        for block in content_list:
+    chunks: List[str] = []
+    for item in getattr(response, "output", None) or []:
+        for block in getattr(item, "content", None) or []:
             text_value = getattr(block, "text", None) or getattr(block, "value", None)
             if text_value:
                 chunks.append(text_value)
-    if chunks:
-        return "\n".join(chunks).strip()
-
-    if hasattr(response, "output_text"):
-        output_text = getattr(response, "output_text")
-        if isinstance(output_text, list):
-            return "\n".join(output_text).strip()
-        if isinstance(output_text, str):
-            return output_text.strip()
-
-    if hasattr(response, "model_dump"):
-        data = response.model_dump()
-        for item in data.get("output", []):
-            for block in item.get("content", []):
-                text_value = block.get("text") or block.get("value")
-                if text_value:
-                    chunks.append(text_value)
-        if chunks:
-            return "\n".join(chunks).strip()
-
-    return ""
-
-
-def _generate_llm_reply(client: Any, messages: List[Dict[str, Any]], temperature: float = 0.2) -> str:
+    return "\n".join(chunks).strip()
+
+
+def _stream_llm_reply(
+    client: Any, messages: List[Dict[str, Any]], temperature: float = 0.2
+) -> Iterator[str]:
     """
-    Call OpenAI using either Chat Completions or Responses depending on model support.
+    Stream a reply from OpenAI, using either Chat Completions or Responses
+    depending on model support, and yield the text as it arrives.
+
+    Cache hits are yielded in one piece; a completed stream is cached.
     """
-    model_name = os.getenv("OPENAI_CHAT_MODEL", DEFAULT_CHAT_MODEL)
+    model_name = _MODEL_NAME
+    cache_key = make_cache_key(model_name, temperature, messages)
+    cached = get_cached_reply(cache_key)
+    if cached is not None:
+        yield cached
+        return
 
+    parts: List[str] = []
     if _should_use_responses_api(model_name):
-        response = client.responses.create(
+        stream = client.responses.create(
             model=model_name,
             input=_messages_to_responses_input(messages),
             temperature=temperature,
+            stream=True,
         )
-        text = _extract_text_from_responses(response)
-        if text:
-            return text
-        # Fallback to ensure we always return something if parsing fails
-        return "I generated a response but could not parse the text output."
-
-    completion = client.chat.completions.create(
-        model=model_name,
-        messages=messages,
-        temperature=temperature,
-    )
-    return completion.choices[0].message.content
+        for event in stream:
+            event_type = getattr(event, "type", None)
+            if event_type == "response.output_text.delta":
+                parts.append(event.delta)
+                yield event.delta
+            elif event_type == "response.completed" and not parts:
+                # No text deltas arrived; read it off the final response
+                text = _extract_text_from_responses(event.response)
+                if text:
+                    parts.append(text)
+                    yield text
+        if not parts:
+            # Fallback to ensure we always return something if parsing fails
+            yield "I generated a response but could not parse the text output."
+            return
+    else:
+        stream = client.chat.completions.create(
+            model=model_name,
+            messages=messages,
+            temperature=temperature,
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content or ""
+                parts.append(delta)
+                yield delta
+    store_reply(cache_key, "".join(parts))
 
 
 # ---------- Assessment definition ----------
 
-def _get_questions() -> List[Dict[str, Any]]:
-    """
-    Return the fixed set of 5 roadmap-based MCQs.
+# Fixed set of 5 roadmap-based MCQs, each mapped to a pillar/topic from the
+# Data Engineer roadmap. Built once at import and shared read-only.
+_QUESTIONS: Tuple[Dict[str, Any], ...] = (
+    {
+        "id": "q1_python_basics",
+        "pillar": "Foundations",
+        "topic": "Core Skills - Python",
+        "text": "In Python, what is the best way to iterate over a list of items with their index?",
+        "options": [
+            "Use a classic for-loop with range(len(items))",
+            "Use enumerate(items) inside the for-loop",
+            "Manually increment a counter variable inside the loop",
+            "You cannot access index during iteration",
+        ],
+        "correct_index": 1,
+        "difficulty": 1,
+    },
+    {
+        "id": "q2_sql_joins",
+        "pillar": "Storage & Databases",
+        "topic": "Relational Databases - SQL",
+        "text": "Which SQL JOIN returns all rows from the left table and matching rows from the right table?",
+        "options": [
+            "INNER JOIN",
+            "LEFT JOIN (LEFT OUTER JOIN)",
+            "RIGHT JOIN (RIGHT OUTER JOIN)",
+            "FULL OUTER JOIN",
+        ],
+        "correct_index": 1,
+        "difficulty": 1,
+    },
+    {
+        "id": "q3_etl_elt",
+        "pillar": "Data Ingestion & Pipelines",
+        "topic": "Pipeline Fundamentals - ETL vs ELT",
+        "text": "What is the main difference between ETL and ELT?",
+        "options": [
+            "ETL transforms data after loading it into the warehouse; ELT transforms before loading",
+            "ETL transforms data before loading into the warehouse; ELT transforms after loading",
+            "They are exactly the same",
+            "ETL is only for batch, ELT only for streaming",
+        ],
+        "correct_index": 1,
+        "difficulty": 2,
+    },
+    {
+        "id": "q4_batch_streaming",
+        "pillar": "Data Ingestion & Pipelines",
+        "topic": "Ingestion Types - Batch vs Streaming",
+        "text": "Which statement best describes streaming ingestion?",
+        "options": [
+            "Data is loaded once per day as a single bulk file",
+            "Data is ingested as continuous events with low latency",
+            "Data is copied manually by engineers",
+            "Streaming ingestion does not support real-time analytics",
+        ],
+        "correct_index": 1,
+        "difficulty": 2,
+    },
+    {
+        "id": "q5_cloud_services",
+        "pillar": "Big Data & Infrastructure",
+        "topic": "Cloud Platforms - AWS / Azure / GCP",
+        "text": "In a typical cloud architecture, which service is most appropriate for object storage?",
+        "options": [
+            "Amazon S3 or Azure Blob Storage",
+            "Managed relational database (e.g., Amazon RDS)",
+            "Virtual machines (EC2, VM, Compute Engine)",
+            "Serverless compute (AWS Lambda, Azure Functions)",
+        ],
+        "correct_index": 0,
+        "difficulty": 2,
+    },
+)
 
-    Each question maps to a pillar/topic from the Data Engineer roadmap.
-    """
-    return [
-        {
-            "id": "q1_python_basics",
-            "pillar": "Foundations",
-            "topic": "Core Skills - Python",
-            "text": "In Python, what is the best way to iterate over a list of items with their index?",
-            "options": [
-                "Use a classic for-loop with range(len(items))",
-                "Use enumerate(items) inside the for-loop",
-                "Manually increment a counter variable inside the loop",
-                "You cannot access index during iteration",
-            ],
-            "correct_index": 1,
-            "difficulty": 1,
-        },
-        {
-            "id": "q2_sql_joins",
-            "pillar": "Storage & Databases",
-            "topic": "Relational Databases - SQL",
-            "text": "Which SQL JOIN returns all rows from the left table and matching rows from the right table?",
-            "options": [
-                "INNER JOIN",
-                "LEFT JOIN (LEFT OUTER JOIN)",
-                "RIGHT JOIN (RIGHT OUTER JOIN)",
-                "FULL OUTER JOIN",
-            ],
-            "correct_index": 1,
-            "difficulty": 1,
-        },
-        {
-            "id": "q3_etl_elt",
-            "pillar": "Data Ingestion & Pipelines",
-            "topic": "Pipeline Fundamentals - ETL vs ELT",
-            "text": "What is the main difference between ETL and ELT?",
-            "options": [
-                "ETL transforms data after loading it into the warehouse; ELT transforms before loading",
-                "ETL transforms data before loading into the warehouse; ELT transforms after loading",
-                "They are exactly the same",
-                "ETL is only for batch, ELT only for streaming",
-            ],
-            "correct_index": 1,
-            "difficulty": 2,
-        },
-        {
-            "id": "q4_batch_streaming",
-            "pillar": "Data Ingestion & Pipelines",
-            "topic": "Ingestion Types - Batch vs Streaming",
-            "text": "Which statement best describes streaming ingestion?",
-            "options": [
-                "Data is loaded once per day as a single bulk file",
-                "Data is ingested as continuous events with low latency",
-                "Data is copied manually by engineers",
-                "Streaming ingestion does not support real-time analytics",
-            ],
-            "correct_index": 1,
-            "difficulty": 2,
-        },
-        {
-            "id": "q5_cloud_services",
-            "pillar": "Big Data & Infrastructure",
-            "topic": "Cloud Platforms - AWS / Azure / GCP",
-            "text": "In a typical cloud architecture, which service is most appropriate for object storage?",
-            "options": [
-                "Amazon S3 or Azure Blob Storage",
-                "Managed relational database (e.g., Amazon RDS)",
-                "Virtual machines (EC2, VM, Compute Engine)",
-                "Serverless compute (AWS Lambda, Azure Functions)",
-            ],
-            "correct_index": 0,
-            "difficulty": 2,
-        },
-    ]
+
+def _get_questions() -> Tuple[Dict[str, Any], ...]:
+    """Return the fixed assessment questions (shared, do not mutate)."""
+    return _QUESTIONS
 
 
 # ---------- Utility: compute level & summary ----------
@@ -361,27 +479,13 @@ def _compute_level_and_summary(answers: List[Dict[str, Any]]) -> Dict[str, Any]:
         if a.get("correct"):
             pillar_stats[pillar]["correct"] += 1
 
-    # Compute weakest pillar(s) as recommendations
-    weakest_pillar = None
-    weakest_accuracy = 1.1
-    for pillar, stats in pillar_stats.items():
-        acc = stats["correct"] / stats["total"]
-        if acc < weakest_accuracy:
-            weakest_accuracy = acc
-            weakest_pillar = pillar
-
-    primary = None
-    secondary: List[str] = []
-    if weakest_pillar:
-        primary = weakest_pillar
-        # Recommend all pillars sorted by increasing accuracy
-        sorted_pillars = sorted(
-            pillar_stats.items(),
-            key=lambda kv: kv[1]["correct"] / kv[1]["total"],
-        )
-        for pillar, _ in sorted_pillars:
-            if pillar != weakest_pillar:
-                secondary.append(pillar)
+    # Rank pillars by accuracy once; the weakest becomes the primary focus.
+    # sort() is stable, so ties keep answer order as before.
+    ratios = [(pillar, stats["correct"] / stats["total"]) for pillar, stats in pillar_stats.items()]
+    ratios.sort(key=operator.itemgetter(1))
+
+    primary = ratios[0][0] if ratios else None
+    secondary: List[str] = [pillar for pillar, _ in ratios[1:]]
 
     return {
         "score": score,
@@ -392,36 +496,168 @@ def _compute_level_and_summary(answers: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def _summary_from_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a tutor_assessment_completed event onto the public summary shape."""
+    data = event.get("data", {})
+    return {
+        "level": data.get("level"),
+        "last_assessed_at": _format_timestamp(event.get("timestamp")),
+        "primary_recommendation": data.get("primary_recommendation"),
+        "secondary_recommendations": data.get("secondary_recommendations", []),
+    }
+
+
+def _log_signature() -> List[int]:
+    """Return [size, mtime_ns, inode] of the events log; zeros if it is missing."""
+    try:
+        stat = os.stat(_EVENTS_PATH)
+    except OSError:
+        return [0, 0, 0]
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+
+def _write_summary_index(index: Dict[str, Any]) -> None:
+    """Atomically replace the summary index file."""
+    # A temp file per writer, so concurrent sessions never share one
+    fd, tmp_path = tempfile.mkstemp(dir=_DATA_DIR, prefix="latest_summary.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp_path, _SUMMARY_INDEX_PATH)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _rebuild_summary_index(signature: List[int]) -> Dict[str, Any]:
+    """Rebuild the latest-summary index with one pass over the events log."""
+    users: Dict[str, Dict[str, Any]] = {}
+    try:
+        for ev in _iter_events():
+            if ev.get("type") == "tutor_assessment_completed":
+                users[ev.get("user_id")] = _summary_from_event(ev)
+    except OSError:
+        pass
+    index = {"log": signature, "users": users}
+    try:
+        _write_summary_index(index)
+    except OSError:
+        pass
+    return index
+
+
+def _load_summary_index() -> Dict[str, Any]:
+    """Return the per-user latest-summary index, rebuilding it if missing or stale."""
+    # Taken before any rebuild scans the log, so events appended meanwhile
+    # leave the index marked stale rather than silently missing
+    signature = _log_signature()
+    try:
+        with open(_SUMMARY_INDEX_PATH, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        # Only trusted for the exact log it was built from: any append, reset
+        # or replacement changes the size, mtime or inode
+        if index.get("log") == signature:
+            return index
+    except (OSError, ValueError):
+        pass
+    return _rebuild_summary_index(signature)
+
+
+def _refresh_summary_index() -> None:
+    """Write the queued events and bring the on-disk index up to date with them."""
+    _flush_events()
+    _load_summary_index()
+
+
 def get_latest_summary(user_id: str) -> Dict[str, Any]:
     """
     Public helper used by the main Streamlit app to show tutor insights.
 
     Returns a dict with 'level', 'last_assessed_at', 'primary_recommendation',
-    'secondary_recommendations' if available.
+    'secondary_recommendations' if available. Reads the compact per-user
+    index, which is only rebuilt from the events log after the log changes.
     """
-    events = _load_events()
-    latest: Dict[str, Any] = {}
-    for ev in events:
-        if ev.get("user_id") != user_id:
-            continue
-        if ev.get("type") == "tutor_assessment_completed":
-            latest = ev
+    _migrate_legacy_events()
+    _flush_events()
+    return dict(_load_summary_index().get("users", {}).get(user_id, {}))
 
-    if not latest:
-        return {}
 
-    data = latest.get("data", {})
-    return {
-        "level": data.get("level"),
-        "last_assessed_at": latest.get("timestamp"),
-        "primary_recommendation": data.get("primary_recommendation"),
-        "secondary_recommendations": data.get("secondary_recommendations", []),
-    }
+# ---------- Static panel markup ----------
+
+_PANEL_HEADER_HTML_TMPL = """
+<div style="background-color: #050505; border-radius: 12px; padding: 1rem 1.25rem; border: 1px solid #222;">
+    <h3 style="color: #FFFFFF; margin: 0 0 0.5rem 0;">🤖 Adaptive AI Tutor</h3>
+    <p style="color: #CCCCCC; margin: 0 0 1rem 0; font-size: 0.9rem;">
+        Hi {name}, I'm your tutor for the <span style="color: #CF3A4E;">Data Engineer Roadmap</span>.
+        I'll ask a few quick questions to estimate your level and then suggest what to learn next.
+    </p>
+</div>
+"""
+
+_FIRST_VISIT_HTML = """
+<p style="color: #FFFFFF; font-weight: 600; margin-bottom: 0.5rem;">
+    First time here? Let's run a quick 5-question check-up.
+</p>
+<p style="color: #AAAAAA; font-size: 0.9rem; margin-bottom: 0.75rem;">
+    It will help me understand your current skills and customize your roadmap.
+</p>
+"""
+
+_INTRO_HTML_TMPL = """
+<p style="color: #FFFFFF; font-weight: 600; margin-bottom: 0.5rem;">
+    Welcome back! Your current Data Engineer level is
+    <span style="color:#CF3A4E;">L{level} – {level_label}</span>.
+</p>
+"""
+
+_SUMMARY_HTML_TMPL = """
+<p style="color:#FFFFFF; font-weight:600; margin-bottom:0.5rem;">
+    Great job! Your current Data Engineer level is
+    <span style="color:#CF3A4E;">L{level} – {level_label}</span>.
+</p>
+"""
+
+_FOCUS_HTML_TMPL = """
+<div style="background-color:#111; border-radius:8px; padding:0.75rem; border:1px solid #222; margin-bottom:0.75rem;">
+    <p style="color:#CCCCCC; font-size:0.85rem; margin:0;">
+        <strong>Focus next:</strong> {primary}<br>
+        <strong>Also explore:</strong> {sec_text}
+    </p>
+</div>
+"""
+
+_QUESTION_HTML_TMPL = """
+<p style="color:#AAAAAA; font-size:0.85rem; margin-bottom:0.25rem;">
+    Question {number} of {total}
+</p>
+<p style="color:#FFFFFF; font-weight:600; margin-bottom:0.5rem;">
+    {text}
+</p>
+"""
+
+_CHAT_HEADER_HTML = """
+<p style="color:#FFFFFF; font-weight:600; margin-bottom:0.5rem;">
+    Chat with your tutor
+</p>
+<p style="color:#AAAAAA; font-size:0.85rem; margin-bottom:0.5rem;">
+    Ask questions about the roadmap, topics, or your next steps.
+</p>
+"""
 
 
 # ---------- Streamlit tutor panel ----------
 
-def _init_tutor_state():
+def _get_session_summary(user_id: str) -> Dict[str, Any]:
+    """Return the session's latest summary, reading disk only on first visit."""
+    if "tutor_latest_summary" in st.session_state:
+        return st.session_state.tutor_latest_summary
+    return get_latest_summary(user_id)
+
+
+def _init_tutor_state(user_id: str):
     """Initialize tutor-related session state variables."""
     if "tutor_stage" not in st.session_state:
         st.session_state.tutor_stage = "intro"  # intro, question, summary
@@ -432,20 +668,35 @@ def _init_tutor_state():
     if "tutor_current_choice" not in st.session_state:
         st.session_state.tutor_current_choice = None
     if "tutor_chat_messages" not in st.session_state:
-        st.session_state.tutor_chat_messages = []
+        st.session_state.tutor_chat_messages = deque(maxlen=CHAT_HISTORY_LIMIT)
+    if "tutor_recent_messages" not in st.session_state:
+        st.session_state.tutor_recent_messages = deque(
+            st.session_state.tutor_chat_messages, maxlen=LLM_CONTEXT_MESSAGES
+        )
+    if "tutor_show_full_history" not in st.session_state:
+        st.session_state.tutor_show_full_history = False
     if "tutor_show_practice_summary" not in st.session_state:
         st.session_state.tutor_show_practice_summary = False
     if "tutor_last_digest_signature" not in st.session_state:
         st.session_state.tutor_last_digest_signature = None
+    if "pending_tutor_events" not in st.session_state:
+        st.session_state.pending_tutor_events = []
+    if "tutor_latest_summary" not in st.session_state:
+        # Read from disk once; afterwards this session keeps it up to date
+        st.session_state.tutor_latest_summary = get_latest_summary(user_id)
+
+
+def _get_llm_client() -> Any:
+    """Create the OpenAI client on first chat use; None if unavailable."""
     if "tutor_llm_client" not in st.session_state:
-        # Lazily create an OpenAI client if available
+        client = None
         if OpenAI is not None:
             try:
-                st.session_state.tutor_llm_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+                client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
             except Exception:
-                st.session_state.tutor_llm_client = None
-        else:
-            st.session_state.tutor_llm_client = None
+                client = None
+        st.session_state.tutor_llm_client = client
+    return st.session_state.tutor_llm_client
 
 
 def render_ai_tutor_panel(user_name: str = "Mukesh", user_id: str = "Mukesh"):
@@ -454,61 +705,36 @@ def render_ai_tutor_panel(user_name: str = "Mukesh", user_id: str = "Mukesh"):
 
     This should be called inside a right-side column on the roadmap page.
     """
-    _init_tutor_state()
+    _init_tutor_state(user_id)
     questions = _get_questions()
 
-    st.markdown(
-        """
-        <div style="background-color: #050505; border-radius: 12px; padding: 1rem 1.25rem; border: 1px solid #222;">
-            <h3 style="color: #FFFFFF; margin: 0 0 0.5rem 0;">🤖 Adaptive AI Tutor</h3>
-            <p style="color: #CCCCCC; margin: 0 0 1rem 0; font-size: 0.9rem;">
-                Hi {name}, I'm your tutor for the <span style="color: #CF3A4E;">Data Engineer Roadmap</span>.
-                I'll ask a few quick questions to estimate your level and then suggest what to learn next.
-            </p>
-        </div>
-        """.format(
-            name=user_name
-        ),
-        unsafe_allow_html=True,
-    )
+    st.markdown(_PANEL_HEADER_HTML_TMPL.format(name=user_name), unsafe_allow_html=True)
 
     # Check if user already has a completed assessment
-    summary = get_latest_summary(user_id)
+    summary = _get_session_summary(user_id)
     has_profile = bool(summary)
 
-    if st.session_state.tutor_stage == "intro":
-        _render_intro_stage(has_profile, summary)
-    elif st.session_state.tutor_stage == "question":
-        _render_question_stage(user_id, questions)
-    elif st.session_state.tutor_stage == "summary":
-        _render_summary_stage(user_id, summary_override=None)
+    try:
+        if st.session_state.tutor_stage == "intro":
+            _render_intro_stage(has_profile, summary)
+        elif st.session_state.tutor_stage == "question":
+            _render_question_stage(user_id, questions)
+        elif st.session_state.tutor_stage == "summary":
+            _render_summary_stage(user_id, summary_override=None)
 
-    # Chat section is always available under the assessment / summary
-    _render_chat_section(user_id, user_name=user_name)
+        # Chat section is always available under the assessment / summary
+        _render_chat_section(user_id, user_name=user_name)
+    finally:
+        # One append per rerun, even if the run is interrupted
+        _flush_events()
 
 
 def _render_intro_stage(has_profile: bool, summary: Dict[str, Any]):
     """Render first-time vs returning-user intro."""
     st.markdown("---")
-    LEVEL_LABELS = {
-        1: "Beginner",
-        2: "Emerging",
-        3: "Proficient",
-        4: "Advanced",
-    }
 
     if not has_profile:
-        st.markdown(
-            """
-            <p style="color: #FFFFFF; font-weight: 600; margin-bottom: 0.5rem;">
-                First time here? Let's run a quick 5-question check-up.
-            </p>
-            <p style="color: #AAAAAA; font-size: 0.9rem; margin-bottom: 0.75rem;">
-                It will help me understand your current skills and customize your roadmap.
-            </p>
-            """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(_FIRST_VISIT_HTML, unsafe_allow_html=True)
         if st.button("Start Assessment", key="tutor_start_assessment", use_container_width=True):
             st.session_state.tutor_stage = "question"
             st.session_state.tutor_question_index = 0
@@ -520,25 +746,13 @@ def _render_intro_stage(has_profile: bool, summary: Dict[str, Any]):
         primary = summary.get("primary_recommendation")
         secondary = summary.get("secondary_recommendations", [])
         st.markdown(
-            f"""
-            <p style="color: #FFFFFF; font-weight: 600; margin-bottom: 0.5rem;">
-                Welcome back! Your current Data Engineer level is
-                <span style="color:#CF3A4E;">L{level} – {level_label}</span>.
-            </p>
-            """,
+            _INTRO_HTML_TMPL.format(level=level, level_label=level_label),
             unsafe_allow_html=True,
         )
         if primary:
             sec_text = ", ".join(secondary) if secondary else "None yet"
             st.markdown(
-                f"""
-                <div style="background-color:#111; border-radius:8px; padding:0.75rem; border:1px solid #222; margin-bottom:0.75rem;">
-                    <p style="color:#CCCCCC; font-size:0.85rem; margin:0;">
-                        <strong>Focus next:</strong> {primary}<br>
-                        <strong>Also explore:</strong> {sec_text}
-                    </p>
-                </div>
-                """,
+                _FOCUS_HTML_TMPL.format(primary=primary, sec_text=sec_text),
                 unsafe_allow_html=True,
             )
         col1, col2 = st.columns(2)
@@ -557,21 +771,16 @@ def _render_intro_stage(has_profile: bool, summary: Dict[str, Any]):
                 st.session_state.tutor_show_practice_summary = True
 
 
-def _render_question_stage(user_id: str, questions: List[Dict[str, Any]]):
+def _render_question_stage(user_id: str, questions: Sequence[Dict[str, Any]]):
     """Render the current question and handle navigation."""
     idx = st.session_state.tutor_question_index
     question = questions[idx]
 
     st.markdown("---")
     st.markdown(
-        f"""
-        <p style="color:#AAAAAA; font-size:0.85rem; margin-bottom:0.25rem;">
-            Question {idx + 1} of {len(questions)}
-        </p>
-        <p style="color:#FFFFFF; font-weight:600; margin-bottom:0.5rem;">
-            {question['text']}
-        </p>
-        """,
+        _QUESTION_HTML_TMPL.format(
+            number=idx + 1, total=len(questions), text=question["text"]
+        ),
         unsafe_allow_html=True,
     )
 
@@ -628,7 +837,7 @@ def _render_question_stage(user_id: str, questions: List[Dict[str, Any]]):
             else:
                 # Completed all questions -> compute summary
                 summary = _compute_level_and_summary(st.session_state.tutor_answers)
-                _log_event(
+                record = _log_event(
                     "tutor_assessment_completed",
                     user_id,
                     {
@@ -639,20 +848,17 @@ def _render_question_stage(user_id: str, questions: List[Dict[str, Any]]):
                         "secondary_recommendations": summary["secondary_recommendations"],
                     },
                 )
+                latest_summary = _summary_from_event(record)
+                _refresh_summary_index()
+                st.session_state.tutor_latest_summary = latest_summary
                 st.session_state.tutor_stage = "summary"
 
 
 def _render_summary_stage(user_id: str, summary_override: Dict[str, Any] = None):
     """Render summary based on latest assessment."""
     st.markdown("---")
-    LEVEL_LABELS = {
-        1: "Beginner",
-        2: "Emerging",
-        3: "Proficient",
-        4: "Advanced",
-    }
 
-    summary = summary_override or get_latest_summary(user_id)
+    summary = summary_override or _get_session_summary(user_id)
     if not summary:
         st.write("No summary available yet.")
         return
@@ -663,26 +869,14 @@ def _render_summary_stage(user_id: str, summary_override: Dict[str, Any] = None)
     secondary = summary.get("secondary_recommendations", [])
 
     st.markdown(
-        f"""
-        <p style="color:#FFFFFF; font-weight:600; margin-bottom:0.5rem;">
-            Great job! Your current Data Engineer level is
-            <span style="color:#CF3A4E;">L{level} – {level_label}</span>.
-        </p>
-        """,
+        _SUMMARY_HTML_TMPL.format(level=level, level_label=level_label),
         unsafe_allow_html=True,
     )
 
     if primary:
         sec_text = ", ".join(secondary) if secondary else "None yet"
         st.markdown(
-            f"""
-            <div style="background-color:#111; border-radius:8px; padding:0.75rem; border:1px solid #222; margin-bottom:0.75rem;">
-                <p style="color:#CCCCCC; font-size:0.85rem; margin:0;">
-                    <strong>Focus next:</strong> {primary}<br>
-                    <strong>Also explore:</strong> {sec_text}
-                </p>
-            </div>
-            """,
+            _FOCUS_HTML_TMPL.format(primary=primary, sec_text=sec_text),
             unsafe_allow_html=True,
         )
 
@@ -692,20 +886,16 @@ def _render_summary_stage(user_id: str, summary_override: Dict[str, Any] = None)
         st.session_state.show_ai_tutor = False
 
 
+def _append_chat_message(message: Dict[str, Any]) -> None:
+    """Record a chat message in both the history and the LLM context window."""
+    st.session_state.tutor_chat_messages.append(message)
+    st.session_state.tutor_recent_messages.append(message)
+
+
 def _render_chat_section(user_id: str, user_name: str = "Student") -> None:
     """Render a simple chat interface with the AI tutor."""
     st.markdown("---")
-    st.markdown(
-        """
-        <p style="color:#FFFFFF; font-weight:600; margin-bottom:0.5rem;">
-            Chat with your tutor
-        </p>
-        <p style="color:#AAAAAA; font-size:0.85rem; margin-bottom:0.5rem;">
-            Ask questions about the roadmap, topics, or your next steps.
-        </p>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_CHAT_HEADER_HTML, unsafe_allow_html=True)
 
     user_input = st.chat_input("Type your question for the tutor...")
 
@@ -716,21 +906,34 @@ def _render_chat_section(user_id: str, user_name: str = "Student") -> None:
         last_signature = st.session_state.get("tutor_last_digest_signature")
         if current_signature != last_signature:
             summary_msg = {"role": "assistant", "content": digest}
-            st.session_state.tutor_chat_messages.append(summary_msg)
+            _append_chat_message(summary_msg)
             _log_event("tutor_chat_message", user_id, summary_msg)
             st.session_state.tutor_last_digest_signature = current_signature
         st.session_state.tutor_show_practice_summary = False
 
-    # Show chat history (existing messages)
-    for msg in st.session_state.tutor_chat_messages:
-        role = msg.get("role", "assistant")
-        with st.chat_message(role):
-            st.markdown(msg.get("content", ""))
+    # Show chat history (existing messages), only the latest window by default
+    history = st.session_state.tutor_chat_messages
+    hidden_count = len(history) - CHAT_RENDER_WINDOW
+    if hidden_count > 0:
+        label = (
+            "Show recent messages only"
+            if st.session_state.tutor_show_full_history
+            else f"Show {hidden_count} earlier messages"
+        )
+        if st.button(label, key="tutor_toggle_history"):
+            st.session_state.tutor_show_full_history = not st.session_state.tutor_show_full_history
+    if hidden_count > 0 and not st.session_state.tutor_show_full_history:
+        visible = itertools.islice(history, hidden_count, None)
+    else:
+        visible = history
+    with st.container():
+        for msg in visible:
+            role = msg.get("role", "assistant")
+            with st.chat_message(role):
+                st.markdown(msg.get("content", ""))
     if user_input:
         # Log user message
-        st.session_state.tutor_chat_messages.append(
-            {"role": "user", "content": user_input}
-        )
+        _append_chat_message({"role": "user", "content": user_input})
         with st.chat_message("user"):
             st.markdown(user_input)
         _log_event(
@@ -739,49 +942,44 @@ def _render_chat_section(user_id: str, user_name: str = "Student") -> None:
             {"role": "user", "content": user_input},
         )
 
-        # Generate tutor response
+        # Generate tutor response, streaming tokens as they arrive
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                client = st.session_state.tutor_llm_client
-                if client is not None:
-                    try:
-                        # Lightweight LLM call focused on DE roadmap topics
-                        system_prompt = (
-                            "You are an Adaptive AI Tutor for Data Engineers. "
-                            "Focus ONLY on data engineering topics such as Python, SQL, "
-                            "data storage, data pipelines, batch vs streaming, cloud "
-                            "services, governance and testing. "
-                            "Explain concepts clearly and concisely using step-by-step "
-                            "reasoning when helpful. Do NOT ask quiz questions unless "
-                            "the user explicitly requests practice questions."
-                        )
-                        chat_history = [
-                            {"role": m["role"], "content": m["content"]}
-                            for m in st.session_state.tutor_chat_messages[-6:]
-                        ]
-                        messages = [{"role": "system", "content": system_prompt}] + chat_history
-                        response = _generate_llm_reply(client, messages)
-                    except Exception as exc:
-                        st.warning(f"LLM call failed: {exc}")
-                        response = (
-                            "I'm having trouble contacting the full AI service right now, "
-                            "but conceptually: I am your Data Engineer tutor. Ask me about "
-                            "storage, pipelines, SQL, or cloud and I'll guide you based on "
-                            "the roadmap."
-                        )
-                else:
+            placeholder = st.empty()
+            client = _get_llm_client()
+            if client is not None:
+                try:
+                    # Lightweight LLM call focused on DE roadmap topics
+                    chat_history = [
+                        {"role": m["role"], "content": m["content"]}
+                        for m in st.session_state.tutor_recent_messages
+                    ]
+                    messages = [{"role": "system", "content": TUTOR_SYSTEM_PROMPT}] + chat_history
+                    # Keep the spinner up only until the first token lands
+                    with st.spinner("Thinking..."):
+                        chunks = _stream_llm_reply(client, messages)
+                        first_chunk = next(chunks, "")
+                    with placeholder.container():
+                        response = st.write_stream(itertools.chain([first_chunk], chunks))
+                except Exception as exc:
+                    st.warning(f"LLM call failed: {exc}")
                     response = (
-                        "I don't have direct access to the LLM in this environment, but "
-                        "I'm your Data Engineer tutor. Use the roadmap and assessment "
-                        "above as your guide, and we can still talk through concepts."
+                        "I'm having trouble contacting the full AI service right now, "
+                        "but conceptually: I am your Data Engineer tutor. Ask me about "
+                        "storage, pipelines, SQL, or cloud and I'll guide you based on "
+                        "the roadmap."
                     )
-                response = response.strip()
-                if user_name and user_name.lower() not in response.lower():
-                    response = f"{user_name}, {response}"
-                st.markdown(response)
-            st.session_state.tutor_chat_messages.append(
-                {"role": "assistant", "content": response}
-            )
+            else:
+                response = (
+                    "I don't have direct access to the LLM in this environment, but "
+                    "I'm your Data Engineer tutor. Use the roadmap and assessment "
+                    "above as your guide, and we can still talk through concepts."
+                )
+            response = str(response or "").strip()
+            if user_name and user_name.lower() not in response.lower():
+                response = f"{user_name}, {response}"
+            # Replace the streamed output with the final (possibly prefixed) text
+            placeholder.markdown(response)
+            _append_chat_message({"role": "assistant", "content": response})
             _log_event(
                 "tutor_chat_message",
                 user_id,
@@ -8,156 +8,366 @@ time-on-task, streaks, personalization, and a Skill-O-Meter gauge.
 
 from __future__ import annotations
 
+import bisect
+import functools
 import json
 import os
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Tuple
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
-import plotly.graph_objects as go
+import numpy as np
 import streamlit as st
 
+from components.analytics_kernels import sessionize, streak_from_days
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# orjson parses the many small event dicts noticeably faster; both accept bytes
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+if msgspec is not None:
+
+    class TutorEvent(msgspec.Struct, kw_only=True):
+        """One logged tutor event; unknown top-level fields are ignored."""
+
+        type: Optional[str] = None
+        user_id: Optional[str] = None
+        timestamp: Union[float, str, None] = None
+        data: Optional[Dict[str, Any]] = None
+
+    # Typed decoding straight into structs, skipping the intermediate dict
+    _decode_event = msgspec.json.Decoder(TutorEvent).decode
+    _DECODE_ERRORS: Tuple[type, ...] = (ValueError, msgspec.DecodeError)
+
+    def _event_from_dict(record: Dict[str, Any]) -> TutorEvent:
+        return msgspec.convert(record, TutorEvent)
+
+else:
+
+    class TutorEvent(NamedTuple):
+        """One logged tutor event; unknown top-level fields are ignored."""
+
+        type: Optional[str] = None
+        user_id: Optional[str] = None
+        timestamp: Union[float, str, None] = None
+        data: Optional[Dict[str, Any]] = None
+
+    def _event_from_dict(record: Dict[str, Any]) -> TutorEvent:
+        return TutorEvent(
+            record.get("type"), record.get("user_id"), record.get("timestamp"), record.get("data")
+        )
+
+    def _decode_event(line: bytes) -> TutorEvent:
+        return _event_from_dict(_json_loads(line))
+
+    _DECODE_ERRORS = (ValueError, AttributeError)
+
 # ---------------------------------------------------------------------------
 # Data helpers
 # ---------------------------------------------------------------------------
 
 
+_EVENTS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "tutor_events.jsonl"
+)
+
+
 def _get_events_path() -> str:
-    """Return absolute path to the tutor events log."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(base_dir, "data", "tutor_events.json")
+    """Return absolute path to the tutor events log (JSON Lines)."""
+    return _EVENTS_PATH
 
 
-def _load_events() -> List[Dict[str, Any]]:
-    """Load all stored tutor events."""
+def _parse_event_lines(data: bytes, events: List[TutorEvent]) -> int:
+    """
+    Append events decoded from complete lines in data; return bytes consumed.
+
+    A trailing line without a newline may still be mid-write, so it is left
+    for the next read.
+    """
+    end = data.rfind(b"\n") + 1
+    for line in data[:end].splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            events.append(_decode_event(line))
+        except _DECODE_ERRORS:
+            continue
+    return end
+
+
+EventIndex = Dict[str, List[TutorEvent]]
+
+
+def _index_by_user(events: List[TutorEvent], index: EventIndex) -> None:
+    """Append each event to its user's slice of index."""
+    for event in events:
+        index.setdefault(event.user_id, []).append(event)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_events_cached(
+    path: str, signature: Tuple[int, int]
+) -> Tuple[List[TutorEvent], EventIndex, int]:
+    """
+    Parse the events file at path; cached until its (mtime_ns, size) changes.
+
+    Returns the events, a user_id -> events index, and the byte offset parsed
+    up to. Only the first size bytes are read, so the result matches the
+    signature even while the log is being appended to. The result is shared
+    across reruns and sessions, so callers must treat it as read-only.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read(signature[1])
+    except OSError:
+        return [], {}, 0
+    events: List[TutorEvent] = []
+    if not path.endswith(".jsonl"):
+        # Legacy JSON array written before the tutor migrated the log
+        try:
+            events = [_event_from_dict(record) for record in _json_loads(data)]
+        except _DECODE_ERRORS:
+            return [], {}, 0
+        offset = len(data)
+    else:
+        offset = _parse_event_lines(data, events)
+    index: EventIndex = {}
+    _index_by_user(events, index)
+    return events, index, offset
+
+
+def _resolve_events_path() -> str:
+    """Return the JSONL log, or the legacy JSON array until the tutor migrates it."""
     path = _get_events_path()
     if not os.path.exists(path):
-        return []
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return []
+        path = os.path.splitext(path)[0] + ".json"
+    return path
 
 
-def _parse_timestamp(ts: str) -> datetime | None:
-    """Parse ISO timestamps that may end with Z."""
-    if not ts:
-        return None
+def _load_event_cache() -> Dict[str, Any]:
+    """
+    Return this session's parsed view of the events log.
+
+    The log is append-only, so each session keeps the parsed events, the
+    per-user index and the byte offset in st.session_state and only decodes
+    the appended tail on later reruns. "signature" is the (mtime_ns, size)
+    of the log as read, which identifies the parsed events in any session.
+    """
+    path = _resolve_events_path()
     try:
-        ts_clean = ts.replace("Z", "+00:00")
-        return datetime.fromisoformat(ts_clean)
-    except Exception:
+        stat = os.stat(path)
+    except OSError:
+        st.session_state.pop("_events_cache", None)
+        return {"path": path, "signature": (0, 0), "offset": 0, "events": [], "by_user": {}}
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if not path.endswith(".jsonl"):
+        events, index, offset = _load_events_cached(path, signature)
+        return {
+            "path": path,
+            "signature": signature,
+            "offset": offset,
+            "events": events,
+            "by_user": index,
+        }
+
+    cache = st.session_state.get("_events_cache")
+    cached_mtime, cached_size = cache["signature"] if cache is not None else (0, 0)
+    if (
+        cache is None
+        or cache["path"] != path
+        or cache["inode"] != stat.st_ino
+        or stat.st_size < cached_size
+        or (stat.st_size == cached_size and stat.st_mtime_ns != cached_mtime)
+    ):
+        # First load, or the log was replaced, truncated or rewritten in place:
+        # start from a full parse
+        events, index, offset = _load_events_cached(path, signature)
+        cache = {
+            "path": path,
+            "inode": stat.st_ino,
+            "signature": signature,
+            "offset": offset,
+            "events": list(events),
+            "by_user": {user: list(slice_) for user, slice_ in index.items()},
+        }
+        st.session_state["_events_cache"] = cache
+    elif stat.st_size > cached_size:
+        try:
+            with open(path, "rb") as f:
+                f.seek(cache["offset"])
+                # Stop at the stat'ed size so the data matches the new signature
+                data = f.read(stat.st_size - cache["offset"])
+        except OSError:
+            return cache
+        new_events: List[TutorEvent] = []
+        cache["offset"] += _parse_event_lines(data, new_events)
+        cache["signature"] = signature
+        cache["events"].extend(new_events)
+        _index_by_user(new_events, cache["by_user"])
+    return cache
+
+
+def _load_events() -> List[TutorEvent]:
+    """Load all stored tutor events, one JSON object per line."""
+    return _load_event_cache()["events"]
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_iso_timestamp(ts: str) -> datetime | None:
+    """Parse a legacy ISO string; memoized since reruns see the same values."""
+    if ts.endswith("Z"):
+        ts = ts[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(ts)
+    except ValueError:
         return None
 
 
-def _chunk_sessions(events: List[Dict[str, Any]]) -> List[Tuple[datetime, datetime]]:
-    """
-    Group events into contiguous sessions (30 minute idle timeout).
+def _parse_timestamp(ts: float | str | None) -> datetime | None:
+    """Parse epoch-second timestamps or legacy ISO strings that may end with Z."""
+    if not ts:
+        return None
+    if isinstance(ts, (int, float)):
+        return datetime.fromtimestamp(ts, timezone.utc)
+    if isinstance(ts, str):
+        return _parse_iso_timestamp(ts)
+    return None
 
-    Returns list of (start, end) tuples.
-    """
-    sessions: List[Tuple[datetime, datetime]] = []
-    sorted_events = sorted(
-        (e for e in events if e.get("timestamp")),
-        key=lambda e: e["timestamp"],
-    )
 
-    current_start: datetime | None = None
-    last_time: datetime | None = None
-    idle_limit = timedelta(minutes=30)
+SESSION_IDLE_SECONDS = 30 * 60
+_SECONDS_PER_DAY = 86400
+_EPOCH_DATE = date(1970, 1, 1)
 
-    for event in sorted_events:
-        ts = _parse_timestamp(event["timestamp"])
-        if not ts:
-            continue
-        if current_start is None:
-            current_start = ts
-            last_time = ts
-            continue
-        if ts - (last_time or ts) <= idle_limit:
-            last_time = ts
-            continue
-        sessions.append((current_start, last_time or current_start))
-        current_start = ts
-        last_time = ts
 
-    if current_start:
-        sessions.append((current_start, last_time or current_start))
+def _chunk_sessions(ts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group epoch-second event times into contiguous sessions (30 minute idle timeout).
 
-    return sessions
+    Returns parallel arrays of session start and end times.
+    """
+    # The log is appended in time order, so sorting is usually unnecessary
+    if ts.size > 1 and (np.diff(ts) < 0).any():
+        ts = np.sort(ts)
+    return sessionize(ts, SESSION_IDLE_SECONDS)
 
 
-def _calculate_streak(dates: List[datetime]) -> int:
-    """Calculate consecutive-day streak based on event dates."""
-    if not dates:
+def _calculate_streak(ts: np.ndarray, today: int) -> int:
+    """Calculate consecutive-day streak from epoch-second times; today is an epoch day."""
+    if ts.size == 0:
         return 0
-    unique_dates = {dt.date() for dt in dates}
-    today = datetime.utcnow().date()
-    streak = 0
-    cursor = today
+    days = np.unique((ts // _SECONDS_PER_DAY).astype(np.int64))
+    return streak_from_days(days, today)
+
+
+_KIND_OTHER, _KIND_QUESTION, _KIND_ASSESSMENT = 0, 1, 2
+_EVENT_KINDS = {
+    "tutor_question_answered": _KIND_QUESTION,
+    "tutor_assessment_completed": _KIND_ASSESSMENT,
+}
 
-    while cursor in unique_dates:
-        streak += 1
-        cursor -= timedelta(days=1)
 
-    if streak == 0:
-        # No activity today, start from last active day
-        cursor = max(unique_dates)
-        while cursor in unique_dates:
-            streak += 1
-            cursor -= timedelta(days=1)
+def _user_columns(events: List[TutorEvent]) -> Dict[str, np.ndarray]:
+    """
+    Lay one user's events out as parallel arrays for vectorized aggregation.
 
-    return streak
+    ts holds epoch seconds (NaN when missing), kind an _EVENT_KINDS code;
+    correct, pillar and topic come from question payloads.
+    """
+    n = len(events)
+    ts = np.full(n, np.nan)
+    kind = np.zeros(n, dtype=np.int8)
+    correct = np.zeros(n, dtype=bool)
+    pillar = np.empty(n, dtype=object)
+    topic = np.empty(n, dtype=object)
+    for i, event in enumerate(events):
+        parsed = _parse_timestamp(event.timestamp)
+        if parsed:
+            ts[i] = parsed.timestamp()
+        code = _EVENT_KINDS.get(event.type, _KIND_OTHER)
+        kind[i] = code
+        if code == _KIND_QUESTION:
+            data = event.data or {}
+            correct[i] = bool(data.get("correct"))
+            pillar[i] = data.get("pillar", "General")
+            topic[i] = data.get("topic")
+    return {"ts": ts, "kind": kind, "correct": correct, "pillar": pillar, "topic": topic}
+
+
+def _pillar_stats(pillars: np.ndarray, correct: np.ndarray) -> Dict[str, Dict[str, int]]:
+    """Count total/correct answers per pillar, in order of first appearance."""
+    import pandas as pd  # only needed when the assessment has no pillar stats
+
+    grouped = (
+        pd.Series(correct, index=pillars.astype(str))
+        .groupby(level=0, sort=False)
+        .agg(total="count", correct="sum")
+    )
+    return {
+        pillar: {"total": int(total), "correct": int(hits)}
+        for pillar, total, hits in grouped.itertuples()
+    }
 
 
 def _summarize_user_metrics(user_id: str) -> Dict[str, Any]:
     """Aggregate tutor analytics for a single user."""
-    events = [e for e in _load_events() if e.get("user_id") == user_id]
-    question_events = [e for e in events if e.get("type") == "tutor_question_answered"]
-    assessment_events = [
-        e for e in events if e.get("type") == "tutor_assessment_completed"
-    ]
+    today = (datetime.now(timezone.utc).date() - _EPOCH_DATE).days
+    cache = _load_event_cache()
+    events = cache["by_user"].get(user_id, [])
+    return _summarize_impl(user_id, (cache["path"], *cache["signature"]), today, events)
 
-    sessions = _chunk_sessions(events)
-    total_minutes = 0
-    for start, end in sessions:
-        duration = max(1, int((end - start).total_seconds() / 60))
-        total_minutes += duration
 
-    question_count = len(question_events)
-    correct_count = sum(1 for e in question_events if e["data"].get("correct"))
+@st.cache_data(show_spinner=False, max_entries=64)
+def _summarize_impl(
+    user_id: str, log_key: Tuple[str, int, int], today: int, _events: List[TutorEvent]
+) -> Dict[str, Any]:
+    """
+    Compute the summary for user_id from _events, its slice of the log.
+
+    log_key is the (path, mtime_ns, size) of the log the events were read
+    from, the same signature _load_events_cached uses, so it identifies them
+    in every session and _events is left unhashed. Memoized until the log
+    changes or the day rolls over (the streak depends on today).
+    """
+    columns = _user_columns(_events)
+    kind = columns["kind"]
+    ts_arr = columns["ts"]
+    ts_arr = ts_arr[~np.isnan(ts_arr)]
+
+    questions = kind == _KIND_QUESTION
+    question_count = int(np.count_nonzero(questions))
+    correct = columns["correct"] & questions
+    correct_count = int(np.count_nonzero(correct))
+
+    assessments = np.flatnonzero(kind == _KIND_ASSESSMENT)
+    level_entry = _events[assessments[-1]] if assessments.size else None
+    last_assessed = _parse_timestamp(level_entry.timestamp) if level_entry else None
+
+    starts, ends = _chunk_sessions(ts_arr)
+    total_minutes = int(np.maximum(1, ((ends - starts) // 60).astype(np.int64)).sum())
+
     accuracy = correct_count / question_count if question_count else 0
 
-    level_entry = assessment_events[-1] if assessment_events else None
-    level_data = level_entry.get("data", {}) if level_entry else {}
+    level_data = (level_entry.data or {}) if level_entry else {}
     level_score = level_data.get("score", accuracy)
     level_value = level_data.get("level", 1)
     pillar_stats = level_data.get("pillar_stats", {})
+    if not pillar_stats and question_count:
+        pillar_stats = _pillar_stats(columns["pillar"][questions], correct[questions])
 
-    if not pillar_stats and question_events:
-        pillar_tracker: Dict[str, Dict[str, int]] = defaultdict(
-            lambda: {"total": 0, "correct": 0}
-        )
-        for event in question_events:
-            pillar = event["data"].get("pillar", "General")
-            pillar_tracker[pillar]["total"] += 1
-            if event["data"].get("correct"):
-                pillar_tracker[pillar]["correct"] += 1
-        pillar_stats = pillar_tracker
-
-    day_timestamps = [
-        _parse_timestamp(e["timestamp"]) for e in events if e.get("timestamp")
-    ]
-    streak_days = _calculate_streak([dt for dt in day_timestamps if dt])
+    streak_days = _calculate_streak(ts_arr, today)
 
     primary_focus = level_data.get("primary_recommendation")
     secondary_focus = level_data.get("secondary_recommendations", [])
-    recent_topics = [
-        event["data"].get("topic")
-        for event in reversed(question_events[-6:])
-        if event["data"].get("topic")
-    ]
+    recent_topics = [topic for topic in columns["topic"][questions][::-1][:6] if topic]
 
     return {
         "level": level_value,
@@ -166,13 +376,13 @@ def _summarize_user_metrics(user_id: str) -> Dict[str, Any]:
         "correct_count": correct_count,
         "accuracy_pct": accuracy * 100,
         "pillar_stats": pillar_stats,
-        "sessions": len(sessions),
+        "sessions": int(starts.size),
         "active_minutes": total_minutes,
         "streak_days": streak_days,
         "primary_focus": primary_focus,
         "secondary_focus": secondary_focus,
         "recent_topics": recent_topics,
-        "last_assessed": _parse_timestamp(level_entry["timestamp"]) if level_entry else None,
+        "last_assessed": last_assessed,
     }
 
 
@@ -188,8 +398,12 @@ LEVEL_LABELS = {
 }
 
 
-def _render_skill_gauge(level: int, score_pct: float) -> None:
-    """Render Skill-O-Meter gauge."""
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_gauge_spec(level: int, score_pct: float) -> Dict[str, Any]:
+    """Build the Skill-O-Meter figure once per (level, score) and keep its dict."""
+    # Plotly is heavy to import and only needed once the panel is shown
+    import plotly.graph_objects as go
+
     thresholds = [
         {"range": [0, 25], "color": "#CF3A4E"},
         {"range": [25, 50], "color": "#F08A24"},
@@ -215,7 +429,36 @@ def _render_skill_gauge(level: int, score_pct: float) -> None:
         )
     )
     fig.update_layout(height=280, margin=dict(l=10, r=10, t=40, b=10))
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_dict()
+
+
+def _render_skill_gauge(level: int, score_pct: float) -> None:
+    """Render Skill-O-Meter gauge."""
+    # Round so near-identical scores share a cached spec
+    st.plotly_chart(_build_gauge_spec(level, round(score_pct, 1)), use_container_width=True)
+
+
+_PILLAR_BAR_THRESHOLDS = [40, 75]
+_PILLAR_BAR_COLORS = ["#CF3A4E", "#F08A24", "#3CB371"]
+_PILLAR_BAR_HTML_TMPL = """
+<div style="margin-bottom: 0.4rem;">
+    <div style="display:flex; justify-content:space-between;">
+        <span style="color:#FFFFFF; font-weight:600;">{pillar}</span>
+        <span style="color:#FFFFFF;">{pct}%</span>
+    </div>
+    <div style="background:#1A1A1A; border-radius:999px; height:8px;">
+        <div style="width:{pct}%; height:8px; border-radius:999px; background:{color};"></div>
+    </div>
+</div>
+"""
+
+
+def _pillar_bar_html(pillar: str, stats: Dict[str, int]) -> str:
+    total = stats.get("total", 1)
+    correct = stats.get("correct", 0)
+    pct = int((correct / total) * 100) if total else 0
+    color = _PILLAR_BAR_COLORS[bisect.bisect_right(_PILLAR_BAR_THRESHOLDS, pct)]
+    return _PILLAR_BAR_HTML_TMPL.format(pillar=pillar, pct=pct, color=color)
 
 
 def _render_pillar_progress(pillar_stats: Dict[str, Dict[str, int]]) -> None:
@@ -224,30 +467,15 @@ def _render_pillar_progress(pillar_stats: Dict[str, Dict[str, int]]) -> None:
         st.info("Answer a few tutor questions to unlock mastery insights.")
         return
 
-    for pillar, stats in pillar_stats.items():
-        total = stats.get("total", 1)
-        correct = stats.get("correct", 0)
-        pct = int((correct / total) * 100) if total else 0
-        bar_color = "#3CB371" if pct >= 75 else "#F08A24" if pct >= 40 else "#CF3A4E"
-        st.markdown(
-            f"""
-            <div style="margin-bottom: 0.4rem;">
-                <div style="display:flex; justify-content:space-between;">
-                    <span style="color:#FFFFFF; font-weight:600;">{pillar}</span>
-                    <span style="color:#FFFFFF;">{pct}%</span>
-                </div>
-                <div style="background:#1A1A1A; border-radius:999px; height:8px;">
-                    <div style="width:{pct}%; height:8px; border-radius:999px; background:{bar_color};"></div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+    # All bars in one markdown element rather than one per pillar
+    st.markdown(
+        "".join([_pillar_bar_html(pillar, stats) for pillar, stats in pillar_stats.items()]),
+        unsafe_allow_html=True,
+    )
 
 
-def _render_stat_card(label: str, value: str, sub: str = "") -> None:
-    st.markdown(
-        f"""
+def _stat_card_html(label: str, value: str, sub: str = "") -> str:
+    return f"""
         <div style="background: #050505; border: 1px solid #222; border-radius: 12px;
                     padding: 1rem; height: 120px;">
             <p style="margin:0; color:#A0AEC0; font-size:0.85rem;">{label}</p>
@@ -255,8 +483,15 @@ def _render_stat_card(label: str, value: str, sub: str = "") -> None:
                 {value}
             </p>
             <p style="margin:0.1rem 0 0 0; color:#718096; font-size:0.85rem;">{sub}</p>
-        </div>
-        """,
+        </div>"""
+
+
+def _render_stat_cards(cards: List[Tuple[str, str, str]]) -> None:
+    """Render stat cards as one 2-column CSS grid in a single markdown element."""
+    st.markdown(
+        '<div style="display:grid; grid-template-columns:1fr 1fr; gap:0.75rem;">'
+        + "".join([_stat_card_html(*card) for card in cards])
+        + "\n</div>",
         unsafe_allow_html=True,
     )
 
@@ -288,29 +523,27 @@ def render_de_analytics_panel(user_id: str = "demo-mukesh", user_name: str = "Mu
     with cols[0]:
         _render_skill_gauge(level, score_pct)
     with cols[1]:
-        c1, c2 = st.columns(2)
-        with c1:
-            minutes = summary["active_minutes"]
-            hours = minutes / 60
-            time_label = f"{hours:.1f} hrs" if minutes >= 60 else f"{minutes} min"
-            _render_stat_card("Time Spent", time_label, "Across tutor sessions")
-        with c2:
-            _render_stat_card(
-                "Questions Answered",
-                str(summary["question_count"]),
-                f"{summary['accuracy_pct']:.0f}% accuracy",
-            )
-        c3, c4 = st.columns(2)
-        with c3:
-            _render_stat_card(
-                "Sessions",
-                str(summary["sessions"]),
-                "Last 30 days" if summary["sessions"] else "No sessions yet",
-            )
-        with c4:
-            streak = summary["streak_days"]
-            streak_text = "🔥 streak alive" if streak else "Start your streak"
-            _render_stat_card("Streak", f"{streak} days", streak_text)
+        minutes = summary["active_minutes"]
+        hours = minutes / 60
+        time_label = f"{hours:.1f} hrs" if minutes >= 60 else f"{minutes} min"
+        streak = summary["streak_days"]
+        streak_text = "🔥 streak alive" if streak else "Start your streak"
+        _render_stat_cards(
+            [
+                ("Time Spent", time_label, "Across tutor sessions"),
+                (
+                    "Questions Answered",
+                    str(summary["question_count"]),
+                    f"{summary['accuracy_pct']:.0f}% accuracy",
+                ),
+                (
+                    "Sessions",
+                    str(summary["sessions"]),
+                    "Last 30 days" if summary["sessions"] else "No sessions yet",
+                ),
+                ("Streak", f"{streak} days", streak_text),
+            ]
+        )
 
     st.markdown("---")
     st.markdown("#### 🧠 Mastery by Pillar")
@@ -0,0 +1,98 @@
+"""
+Analytics Kernels
+-----------------
+
+Numeric kernels behind the analytics panel's session and streak metrics.
+When numba is installed the kernels are JIT-compiled (and cached on disk
+across restarts); otherwise the vectorized NumPy versions are used.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+
+def _sessionize_numpy(ts: np.ndarray, idle: float) -> Tuple[np.ndarray, np.ndarray]:
+    breaks = np.flatnonzero(np.diff(ts) > idle)
+    starts = ts[np.r_[0, breaks + 1]]
+    ends = ts[np.r_[breaks, ts.size - 1]]
+    return starts, ends
+
+
+def _streak_numpy(days: np.ndarray, today: int) -> int:
+    # Count back from today, or from the last active day if nothing today
+    end = int(np.searchsorted(days, today, side="right"))
+    if end and days[end - 1] == today:
+        anchor = today
+    else:
+        anchor, end = days[-1], days.size
+    run = anchor - days[end - 1 :: -1]
+    gaps = np.flatnonzero(run != np.arange(end))
+    return int(gaps[0]) if gaps.size else end
+
+
+def _sessionize_loop(ts: np.ndarray, idle: float) -> Tuple[np.ndarray, np.ndarray]:
+    starts = np.empty(ts.size, dtype=ts.dtype)
+    ends = np.empty(ts.size, dtype=ts.dtype)
+    count = 0
+    starts[0] = ts[0]
+    for i in range(1, ts.size):
+        if ts[i] - ts[i - 1] > idle:
+            ends[count] = ts[i - 1]
+            count += 1
+            starts[count] = ts[i]
+    ends[count] = ts[ts.size - 1]
+    return starts[: count + 1], ends[: count + 1]
+
+
+def _streak_loop(days: np.ndarray, today: int) -> int:
+    anchor = days[days.size - 1]
+    for day in days:
+        if day == today:
+            anchor = today
+            break
+    streak = 0
+    for i in range(days.size - 1, -1, -1):
+        if days[i] > anchor:
+            continue
+        if days[i] != anchor - streak:
+            break
+        streak += 1
+    return streak
+
+
+if njit is not None:
+    _sessionize = njit(cache=True)(_sessionize_loop)
+    _streak = njit(cache=True)(_streak_loop)
+else:
+    _sessionize = _sessionize_numpy
+    _streak = _streak_numpy
+
+
+def sessionize(ts: np.ndarray, idle: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split sorted epoch-second times into sessions at gaps longer than idle.
+
+    Returns parallel arrays of session start and end times.
+    """
+    if ts.size == 0:
+        return ts, ts
+    return _sessionize(ts, idle)
+
+
+def streak_from_days(days: np.ndarray, today: int) -> int:
+    """
+    Length of the consecutive-day run ending today (or the last active day).
+
+    days must be sorted, unique epoch-day numbers.
+    """
+    if days.size == 0:
+        return 0
+    return int(_streak(days, today))
@@ -0,0 +1,80 @@
+"""
+LLM Reply Cache
+---------------
+
+Exact-match cache for tutor LLM replies, stored in SQLite next to the
+analytics log. Keys hash the model, temperature and full message list,
+so a repeated conversation window is answered without a network call.
+The table is bounded and evicts least-recently-used replies.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Dict, List, Optional
+
+MAX_CACHE_ENTRIES = 512
+
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+os.makedirs(_DATA_DIR, exist_ok=True)
+_CACHE_PATH = os.path.join(_DATA_DIR, "llm_cache.sqlite")
+
+
+def _get_cache_path() -> str:
+    """Return absolute path to the SQLite reply cache."""
+    return _CACHE_PATH
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(_get_cache_path(), timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS replies ("
+        "key TEXT PRIMARY KEY, reply TEXT NOT NULL, last_used REAL NOT NULL)"
+    )
+    return conn
+
+
+def make_cache_key(model: str, temperature: float, messages: List[Dict[str, Any]]) -> str:
+    """Hash the request parameters into a stable cache key."""
+    payload = json.dumps(
+        {"m": model, "t": temperature, "msgs": messages},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def get_cached_reply(key: str) -> Optional[str]:
+    """Return the cached reply for key, or None on a miss or cache error."""
+    try:
+        with closing(_connect()) as conn, conn:
+            row = conn.execute("SELECT reply FROM replies WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE replies SET last_used = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+    except sqlite3.Error:
+        return None
+
+
+def store_reply(key: str, reply: str) -> None:
+    """Store a reply and trim the cache to MAX_CACHE_ENTRIES."""
+    if not reply:
+        return
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO replies (key, reply, last_used) VALUES (?, ?, ?)",
+                (key, reply, time.time()),
+            )
+            conn.execute(
+                "DELETE FROM replies WHERE key NOT IN ("
+                "SELECT key FROM replies ORDER BY last_used DESC LIMIT ?)",
+                (MAX_CACHE_ENTRIES,),
+            )
+    except sqlite3.Error:
+        pass
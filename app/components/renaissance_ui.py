@@ -0,0 +1,193 @@
+"""
+Renaissance UI
+--------------
+
+Pieces shared by the landing, onboarding, roadmap selection and Data
+Engineer roadmap pages: the asset paths, the cached logo SVGs, the
+Streamlit compatibility shims, and the base dark theme that each page
+extends with its own rules.
+"""
+
+import os
+import re
+import textwrap
+from pathlib import Path
+
+import streamlit as st
+
+# Resolved once at import rather than on every asset load
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+ASSETS_DIR = PROJECT_ROOT / "assets"
+LOGO_SVG_PATH = ASSETS_DIR / "Renaissance_Symbol_Black.svg"
+LOGOTYPE_SVG_PATH = ASSETS_DIR / "Renaissance_Logotype_Black.svg"
+
+# st.html (Streamlit >= 1.36) skips the markdown parser for pure HTML/CSS blobs
+emit_html = getattr(st, "html", None) or (lambda body: st.markdown(body, unsafe_allow_html=True))
+
+# Fragments rerun on their own when their widgets change (Streamlit >= 1.33);
+# older versions just run the function as part of the full script
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", lambda f: f)
+
+# Set RENAISSANCE_DEBUG_CSS=1 to ship the CSS unminified while styling
+_DEBUG_CSS = os.getenv("RENAISSANCE_DEBUG_CSS") == "1"
+
+_SVG_PREAMBLE = (
+    '<?xml version="1.0" encoding="utf-8"?>',
+    '<!-- Generator: Adobe Illustrator 27.0.1, SVG Export Plug-In . SVG Version: 6.00 Build 0)  -->',
+)
+
+
+def _clean_svg(svg):
+    """Strip the XML declaration and generator comment so the SVG can be inlined."""
+    for prefix in _SVG_PREAMBLE:
+        svg = svg.replace(prefix, "")
+    return svg.strip()
+
+
+def _load_svg(path):
+    """Read and clean one SVG file; None if it is missing or unreadable."""
+    try:
+        # Whole-file byte read, decoded in a single pass
+        return _clean_svg(path.read_bytes().decode("utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def load_symbol_svg():
+    """Load the cleaned Renaissance R symbol SVG (read once per process)."""
+    return _load_svg(LOGO_SVG_PATH)
+
+
+@st.cache_resource(show_spinner=False)
+def load_logotype_svg():
+    """Load the cleaned Renaissance logotype SVG (read once per process)."""
+    return _load_svg(LOGOTYPE_SVG_PATH)
+
+
+def symbol_logo_html(size, margin_bottom, fallback_font_size):
+    """Centered white R symbol at size px, or a text R if the SVG is missing."""
+    logo_svg = load_symbol_svg()
+    if logo_svg:
+        return f"""
+        <div style="display: flex; justify-content: center; margin-bottom: {margin_bottom};">
+            <div class="logo-svg" style="width: {size}px; height: {size}px;">
+                {logo_svg}
+            </div>
+        </div>
+        """
+    return f"""
+        <div style="text-align: center; margin-bottom: {margin_bottom};">
+            <h1 style="color: #FFFFFF; font-size: {fallback_font_size}; font-weight: 700;">R</h1>
+        </div>
+        """
+
+
+# Dark theme rules common to every page
+BASE_THEME_CSS = """
+/* Dark Theme - Minimalist Design */
+
+/* Main background - Black, no page scrolling */
+.stApp, .main {
+    background-color: #000000;
+    overflow: hidden;
+}
+
+.stApp {
+    padding: 0;
+}
+
+/* Hide Streamlit default elements */
+#MainMenu {visibility: hidden;}
+footer {visibility: hidden;}
+header {visibility: hidden;}
+
+/* Typography */
+* {
+    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
+}
+
+h1, h2, h3, h4, p {
+    color: #FFFFFF;
+}
+
+/* Confirmation shown after a choice button, see render_status() */
+.status-ok {
+    background-color: rgba(33, 195, 84, 0.12);
+    border-left: 4px solid #21C354;
+    border-radius: 6px;
+    color: #FFFFFF;
+    padding: 0.75rem 1rem;
+    margin: 0.5rem 0;
+    font-size: 0.95rem;
+    line-height: 1.5;
+}
+
+.status-ok .status-detail {
+    color: #CCCCCC;
+    font-size: 0.85rem;
+}
+
+/* Progress dots drawn by CSS: ::before holds the done steps, ::after the rest */
+.progress-dots {
+    font-size: 0.6rem;
+    letter-spacing: 0.5rem;
+    padding-left: 0.5rem;
+    margin-top: 0.5rem;
+    line-height: 1;
+}
+
+.progress-dots::before {
+    color: #CF3A4E;
+}
+
+.progress-dots::after {
+    color: #333333;
+}
+
+.progress-indicator[data-step="1"] .progress-dots::before { content: "●"; }
+.progress-indicator[data-step="1"] .progress-dots::after { content: "●●"; }
+.progress-indicator[data-step="2"] .progress-dots::before { content: "●●"; }
+.progress-indicator[data-step="2"] .progress-dots::after { content: "●"; }
+.progress-indicator[data-step="3"] .progress-dots::before { content: "●●●"; }
+
+/* Inline logo SVGs fill their sized .logo-svg wrapper in white */
+.logo-svg svg {
+    width: 100%;
+    height: 100%;
+    fill: #FFFFFF;
+    display: block;
+}
+"""
+
+
+def progress_html(step):
+    """Step N of 3 label with its dots; the dots themselves come from the theme CSS."""
+    return (
+        f'<div class="progress-indicator" data-step="{step}">'
+        f'<p>Step {step} of 3</p><div class="progress-dots"></div></div>'
+    )
+
+
+def render_status(message, detail):
+    """One themed confirmation box: a checked message over a muted detail line."""
+    emit_html(f'<div class="status-ok">✓ {message}<br/><span class="status-detail">{detail}</span></div>')
+
+
+def join_html(*blocks):
+    """Join static HTML blocks without blank lines, so markdown keeps them one HTML block."""
+    return "\n".join(textwrap.dedent(block).strip() for block in blocks)
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from CSS rules."""
+    if _DEBUG_CSS:
+        return css
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,>])\s*", r"\1", css).strip()
+
+
+def theme_css(page_css):
+    """The base theme followed by a page's own rules, as one minified <style> block."""
+    return f"<style>{minify_css(BASE_THEME_CSS + page_css)}</style>"
@@ -0,0 +1 @@
+"""Streamlit page modules rendered by main_app."""
@@ -0,0 +1,44 @@
+"""
+Convert Assets
+--------------
+
+Build the WebP versions of the raster images the app shows. The profile
+photo is inlined as a ~45px avatar and the landing feature icons are served
+from app/static/ at 24px, so both are also scaled down (kept at 2-4x for
+high-DPI screens).
+
+Requires Pillow:  pip install Pillow
+Run from the repo root:  python scripts/convert_assets.py
+"""
+
+import os
+
+from PIL import Image
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (source PNG, output WebP, max edge in px or None to keep the size), relative to the repo root
+CONVERSIONS = [
+    ("assets/Muki_US_Photo.png", "assets/Muki_US_Photo.webp", 180),
+    ("app/static/adaptive_learning.png", "app/static/adaptive_learning.webp", 48),
+    ("app/static/RAG.png", "app/static/RAG.webp", 48),
+    ("app/static/Analytics.png", "app/static/Analytics.webp", 48),
+]
+
+WEBP_QUALITY = 85
+
+
+def convert(src_name: str, dst_name: str, max_edge=None) -> None:
+    """Write dst_name as a WebP copy of src_name, optionally downscaled."""
+    src = os.path.join(ROOT_DIR, src_name)
+    dst = os.path.join(ROOT_DIR, dst_name)
+    with Image.open(src) as img:
+        if max_edge:
+            img.thumbnail((max_edge, max_edge), Image.LANCZOS)
+        img.save(dst, "WEBP", quality=WEBP_QUALITY, method=6)
+    print(f"{src_name}: {os.path.getsize(src):,} B -> {dst_name}: {os.path.getsize(dst):,} B")
+
+
+if __name__ == "__main__":
+    for src_name, dst_name, max_edge in CONVERSIONS:
+        convert(src_name, dst_name, max_edge)